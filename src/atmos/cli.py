@@ -7,7 +7,7 @@ from rich import box
 from datetime import datetime
 import asciichartpy
 
-from atmos.core import client
+from atmos.core import get_client
 from atmos.places import places_manager
 from atmos.utils import get_stargazing_conditions
 from atmos.evaluator import SuitabilityEvaluator
@@ -85,7 +85,7 @@ def current(location_arg, location):
     final_location = saved_address if saved_address else target
 
     try:
-        weather = client.get_current_conditions(final_location)
+        weather = get_client().get_current_conditions(final_location)
 
         # Main Layout Grid
         grid = Table.grid(expand=True, padding=(0, 2))
@@ -166,7 +166,7 @@ def history(location_arg, location, hours):
         console.print(
             f"[cyan]Fetching history for {final_location} (Last {hours} hours)...[/cyan]"
         )
-        history_items = client.get_hourly_history(final_location, hours=hours)
+        history_items = get_client().get_hourly_history(final_location, hours=hours)
 
         if not history_items:
             console.print("[yellow]No history data returned.[/yellow]")
@@ -231,7 +231,7 @@ def forecast(location_arg, location, days, hourly):
             console.print(
                 f"[cyan]Fetching hourly forecast for {final_location}...[/cyan]"
             )
-            items = client.get_hourly_forecast(final_location, hours=days * 24)
+            items = get_client().get_hourly_forecast(final_location, hours=days * 24)
 
             table = Table(
                 title=f"Hourly Forecast: {final_location}", box=box.SIMPLE_HEAD
@@ -264,7 +264,7 @@ def forecast(location_arg, location, days, hourly):
             console.print(
                 f"[cyan]Fetching daily forecast for {final_location} ({days} days)...[/cyan]"
             )
-            items = client.get_daily_forecast(final_location, days=days)
+            items = get_client().get_daily_forecast(final_location, days=days)
 
             table = Table(
                 title=f"Daily Forecast: {final_location}", box=box.SIMPLE_HEAD
@@ -327,7 +327,7 @@ def alert(location_arg, location):
 
     try:
         console.print(f"[cyan]Checking for active alerts in {final_location}...[/cyan]")
-        alerts = client.get_public_alerts(final_location)
+        alerts = get_client().get_public_alerts(final_location)
 
         if not alerts:
             console.print("[bold green]✓ No active weather alerts.[/bold green]")
@@ -380,7 +380,7 @@ def graph(location_arg, location, hours, metric):
 
     try:
         console.print(f"[cyan]Fetching forecast for {final_location}...[/cyan]")
-        items = client.get_hourly_forecast(final_location, hours=hours)
+        items = get_client().get_hourly_forecast(final_location, hours=hours)
 
         if not items:
             console.print("[yellow]No data available.[/yellow]")
@@ -450,7 +450,7 @@ def stars(location_arg, location):
     try:
         # Get today's forecast for astronomy data
         console.print(f"[cyan]Fetching astronomy data for {final_location}...[/cyan]")
-        items = client.get_daily_forecast(final_location, days=1)
+        items = get_client().get_daily_forecast(final_location, days=1)
         if not items:
             console.print("[yellow]No data.[/yellow]")
             return
@@ -570,14 +570,15 @@ def find(location_arg, location, activity, days):
         console.print(
             f"[cyan]Searching best day for [bold]{activity}[/bold] in {final_location} (Next {days} days)...[/cyan]"
         )
-        items = client.get_daily_forecast(final_location, days=days)
+        items = get_client().get_daily_forecast(
+            final_location, days=days, include_astronomy=False
+        )
 
-        scored_days = []
-        for item in items:
-            score, reasons = SuitabilityEvaluator.evaluate(item, activity)
-            scored_days.append(
-                {"date": item.date, "score": score, "reasons": reasons, "item": item}
-            )
+        results = SuitabilityEvaluator.evaluate_batch(items, activity)
+        scored_days = [
+            {"date": item.date, "score": score, "reasons": reasons, "item": item}
+            for item, (score, reasons) in zip(items, results)
+        ]
 
         # Sort by Score DESC
         scored_days.sort(key=lambda x: x["score"], reverse=True)
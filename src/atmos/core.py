@@ -1,6 +1,15 @@
+import json
+import logging
+import threading
+import time
+from types import MappingProxyType
 import requests
-from typing import Tuple, List, Dict, Any
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+from typing import Tuple, List, Dict, Any, Mapping, Optional, Type
+from datetime import datetime, timezone
+from functools import lru_cache, partial
 from atmos.config import settings
 from atmos.models import (
     CurrentConditions,
@@ -11,11 +20,79 @@ from atmos.models import (
     HourlyForecastItem,
     DailyForecastItem,
     WeatherAlert,
+    WeatherDashboard,
 )
 from atmos.exceptions import AtmosAPIError
-from rich.console import Console
 
-console = Console()
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:  # optional speedup, see the "fast" extra
+    _loads = json.loads  # type: ignore[assignment]
+
+# (connect, read) timeouts in seconds for every API call.
+_TIMEOUT = (3.05, 10)
+
+# Transient statuses retried with backoff before giving up.
+_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Cache lifetimes in seconds: geocodes are stable, weather is not.
+_GEOCODE_TTL = 24 * 60 * 60
+_RESPONSE_TTL = 60
+# Max payloads held, expired ones included (they back the stale fallback).
+_RESPONSE_CACHE_SIZE = 128
+# Max geocoded locations held; the oldest stored is evicted first.
+_GEOCODE_CACHE_SIZE = 256
+
+# Shared read-only fallback for missing sub-objects in API payloads.
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+_CacheKey = Tuple[str, Tuple[Tuple[str, Any], ...]]
+
+
+def _dig(d: Any, *keys: str, default: Any = None) -> Any:
+    """Walks nested dicts along `keys`, returning `default` on any missing step."""
+    for k in keys:
+        d = d.get(k) if isinstance(d, dict) else None
+        if d is None:
+            return default
+    return d
+
+
+def _float(v: Any, default: float = 0.0) -> float:
+    """float(v), or `default` when the field is missing or an explicit null."""
+    return default if v is None else float(v)
+
+
+def _store(cache: Dict[Any, Any], key: Any, value: Any, size: int) -> None:
+    """Inserts into an insertion-ordered cache, evicting the oldest past `size`."""
+    # Re-insert so dict order tracks storage time.
+    cache.pop(key, None)
+    cache[key] = value
+    if len(cache) > size:
+        del cache[next(iter(cache))]
+
+
+@lru_cache(maxsize=1024)
+def _parse_rfc3339(ts: str) -> datetime:
+    """Parses an API timestamp, fast-pathing the fixed `YYYY-MM-DDTHH:MM:SSZ` form."""
+    if len(ts) == 20 and ts[19] == "Z":
+        try:
+            return datetime(
+                int(ts[0:4]),
+                int(ts[5:7]),
+                int(ts[8:10]),
+                int(ts[11:13]),
+                int(ts[14:16]),
+                int(ts[17:19]),
+                tzinfo=timezone.utc,
+            )
+        except ValueError:
+            pass
+    return datetime.fromisoformat(ts.replace("Z", "+00:00"))
 
 
 class AtmosClient:
@@ -33,10 +110,35 @@ class AtmosClient:
         self.base_url = "https://weather.googleapis.com/v1"
         self.geocode_url = "https://maps.googleapis.com/maps/api/geocode/json"
 
+        # One keep-alive session for both Google hosts; the key rides along
+        # as a default query param on every request.
+        self._session = requests.Session()
+        self._session.params = {"key": self.api_key}
+        # requests already offers gzip/deflate, plus br when brotli is
+        # installed (the "fast" extra); the forecast JSON compresses ~10x.
+        self._session.headers["Accept"] = "application/json"
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=_RETRY_STATUSES,
+            allowed_methods=("GET",),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=16, max_retries=retry)
+        self._session.mount("https://", adapter)
+
+        # normalized location -> (lat, lng, expires_at)
+        self._geo_cache: Dict[str, Tuple[float, float, float]] = {}
+        # (url, params) -> (expires_at, payload)
+        self._response_cache: Dict[_CacheKey, Tuple[float, Dict[str, Any]]] = {}
+        # get_dashboard fetches from worker threads; guards both caches.
+        self._cache_lock = threading.Lock()
+
     def _handle_error(self, resp: requests.Response):
         """Parses API error responses into AtmosAPIError."""
         try:
-            data = resp.json()
+            data = _loads(resp.content)
             err_obj = data.get("error", {})
             msg = err_obj.get("message", resp.text)
 
@@ -53,96 +155,132 @@ class AtmosClient:
 
         raise AtmosAPIError(resp.status_code, msg, resp.text)
 
-    def get_coords(self, location: str) -> Tuple[float, float]:
-        """Resolves a string location to (lat, lng)."""
-        params = {"address": location, "key": self.api_key}
-        resp = requests.get(self.geocode_url, params=params)
+    def _get_json(
+        self, url: str, params: Dict[str, Any], ttl: float = _RESPONSE_TTL
+    ) -> Dict[str, Any]:
+        """GETs a URL on the pooled session and decodes the JSON body.
+
+        Successful payloads are reused for `ttl` seconds (0 disables caching).
+        If the API is still failing after retries, an expired payload is
+        served instead when one is available.
+        """
+        key = (url, tuple(sorted(params.items())))
+        now = time.monotonic()
+        with self._cache_lock:
+            hit = self._response_cache.get(key) if ttl else None
+        if hit is not None and hit[0] > now:
+            return hit[1]
+
+        try:
+            resp = self._session.get(url, params=params, timeout=_TIMEOUT)
+        except requests.RequestException as e:
+            if hit is None:
+                raise
+            logger.warning("Serving stale data for %s: %s", url, e)
+            return hit[1]
 
         if not resp.ok:
+            if hit is not None and resp.status_code in _RETRY_STATUSES:
+                logger.warning(
+                    "Serving stale data for %s: HTTP %s", url, resp.status_code
+                )
+                return hit[1]
             self._handle_error(resp)
 
-        data = resp.json()
+        data = _loads(resp.content)
+        if ttl:
+            with self._cache_lock:
+                _store(
+                    self._response_cache, key, (now + ttl, data), _RESPONSE_CACHE_SIZE
+                )
+        return data
+
+    def get_coords(self, location: str) -> Tuple[float, float]:
+        """Resolves a string location to (lat, lng), cached for 24 hours."""
+        cache_key = location.strip().lower()
+        with self._cache_lock:
+            hit = self._geo_cache.get(cache_key)
+        if hit is not None and hit[2] > time.monotonic():
+            return hit[0], hit[1]
+
+        params = {"address": location}
+        data = self._get_json(self.geocode_url, params, ttl=0)
 
         if not data.get("results"):
             raise ValueError(f"Location not found: {location}")
 
         loc = data["results"][0]["geometry"]["location"]
-        return loc["lat"], loc["lng"]
+        lat, lng = loc["lat"], loc["lng"]
+        entry = (lat, lng, time.monotonic() + _GEOCODE_TTL)
+        with self._cache_lock:
+            _store(self._geo_cache, cache_key, entry, _GEOCODE_CACHE_SIZE)
+        return lat, lng
 
     def _parse_condition(
         self, data: Dict[str, Any]
     ) -> Tuple[Temperature, Temperature, Wind, Precipitation, str, float, float]:
         """Helper to parse common fields from a data block (current or history)."""
-        if data is None:
-            data = {}
+        # Runs once per hourly entry: bind .get once and fall back to a shared
+        # empty mapping instead of allocating a fresh {} for every miss.
+        g = (data or _EMPTY).get
 
         # Temperature
-        temp_obj = data.get("temperature", {})
+        temp_obj = g("temperature") or _EMPTY
         temp = Temperature(
-            value=temp_obj.get("degrees", 0.0), units=temp_obj.get("unit", "CELSIUS")
+            _float(temp_obj.get("degrees")), temp_obj.get("unit", "CELSIUS")
         )
 
-        feels_like_obj = data.get("feelsLikeTemperature", {})
+        feels_like_obj = g("feelsLikeTemperature") or _EMPTY
         feels_like = Temperature(
-            value=feels_like_obj.get("degrees", 0.0),
-            units=feels_like_obj.get("unit", "CELSIUS"),
+            _float(feels_like_obj.get("degrees")),
+            feels_like_obj.get("unit", "CELSIUS"),
         )
 
         # Wind
-        wind_obj = data.get("wind", {})
-        speed_obj = wind_obj.get("speed", {})
-        gust_obj = wind_obj.get("gust", {})
-        direction_obj = wind_obj.get("direction", {})
-
+        wind_get = (g("wind") or _EMPTY).get
         wind = Wind(
-            speed=speed_obj.get("value", 0.0),
-            direction=direction_obj.get("cardinal", "N"),
-            gust=gust_obj.get("value", 0.0),
+            _float((wind_get("speed") or _EMPTY).get("value")),
+            (wind_get("direction") or _EMPTY).get("cardinal", "N"),
+            _float((wind_get("gust") or _EMPTY).get("value")),
         )
 
         # Precipitation
-        precip_obj = data.get("precipitation", {})
-        prob_obj = precip_obj.get("probability", {})
-        qpf_obj = precip_obj.get("qpf", {})
-
+        precip_get = (g("precipitation") or _EMPTY).get
+        prob_get = (precip_get("probability") or _EMPTY).get
         precip = Precipitation(
-            type=prob_obj.get("type", "None"),
-            rate=qpf_obj.get("quantity", 0.0),
-            probability=prob_obj.get("percent", 0.0),
+            prob_get("type", "None"),
+            _float((precip_get("qpf") or _EMPTY).get("quantity")),
+            _float(prob_get("percent")),
         )
 
         # Description
-        cond_obj = data.get("weatherCondition", {})
-        desc_obj = cond_obj.get("description", {})
-        description = desc_obj.get("text", cond_obj.get("type", "Unknown"))
+        cond_obj = g("weatherCondition") or _EMPTY
+        description = _dig(cond_obj, "description", "text")
+        if description is None:
+            description = cond_obj.get("type", "Unknown")
 
         # Pressure
-        pressure_obj = data.get("airPressure", {})
-        pressure = pressure_obj.get("meanSeaLevelMillibars", 1013.25)
+        pressure_obj = g("airPressure") or _EMPTY
+        pressure = _float(pressure_obj.get("meanSeaLevelMillibars"), 1013.25)
 
         # Humidity
-        humidity = data.get("relativeHumidity", 0.0)
+        humidity = _float(g("relativeHumidity"))
 
         return temp, feels_like, wind, precip, description, humidity, pressure
 
     def get_current_conditions(self, location: str) -> CurrentConditions:
         """Fetches real current weather conditions."""
-        lat, lng = self.get_coords(location)
+        return self._current_conditions_at(*self.get_coords(location))
 
+    def _current_conditions_at(self, lat: float, lng: float) -> CurrentConditions:
         url = f"{self.base_url}/currentConditions:lookup"
         params = {
             "location.latitude": lat,
             "location.longitude": lng,
-            "key": self.api_key,
             "unitsSystem": "IMPERIAL",
         }
 
-        resp = requests.get(url, params=params)
-
-        if not resp.ok:
-            self._handle_error(resp)
-
-        data = resp.json()
+        data = self._get_json(url, params)
         cond = data.get("currentConditions", data)
 
         temp, feels_like, wind, precip, desc, humidity, pressure = (
@@ -150,27 +288,58 @@ class AtmosClient:
         )
 
         # Visibility
-        vis_obj = cond.get("visibility", {})
-        vis_val = vis_obj.get("distance", 10.0)
+        vis_val = float(_dig(cond, "visibility", "distance", default=10.0))
 
-        return CurrentConditions(
+        # Fields are already typed by the parser; skip pydantic validation.
+        return CurrentConditions.model_construct(
             temperature=temp,
             feels_like=feels_like,
             humidity=humidity,
             description=desc,
             wind=wind,
             precipitation=precip,
-            uv_index=cond.get("uvIndex", 0),
+            uv_index=int(_float(cond.get("uvIndex"))),
             visibility=vis_val,
             pressure=pressure,
         )
 
+    def _parse_hours(
+        self, entries: List[Dict[str, Any]], cls: Type[HourlyHistoryItem]
+    ) -> List[HourlyHistoryItem]:
+        """Builds hourly items from API entries, skipping ones without a start."""
+        # Bind hot callables once; `make` then only touches fast locals.
+        parse = self._parse_condition
+        parse_ts = _parse_rfc3339
+        construct = cls.model_construct
+
+        def make(entry: Dict[str, Any]) -> Optional[HourlyHistoryItem]:
+            ts_str = _dig(entry, "interval", "startTime")
+            if not ts_str:
+                return None
+
+            temp, feels_like, wind, precip, desc, humidity, pressure = parse(entry)
+            return construct(
+                timestamp=parse_ts(ts_str),
+                temperature=temp,
+                feels_like=feels_like,
+                humidity=humidity,
+                description=desc,
+                wind=wind,
+                precipitation=precip,
+                pressure=pressure,
+            )
+
+        return [item for item in map(make, entries) if item is not None]
+
     def get_hourly_history(
         self, location: str, hours: int = 24
     ) -> List[HourlyHistoryItem]:
         """Fetches hourly history for the last N hours."""
-        lat, lng = self.get_coords(location)
+        return self._hourly_history_at(*self.get_coords(location), hours)
 
+    def _hourly_history_at(
+        self, lat: float, lng: float, hours: int
+    ) -> List[HourlyHistoryItem]:
         url = f"{self.base_url}/history/hours:lookup"
         fetch_hours = min(hours, 24)
 
@@ -178,99 +347,138 @@ class AtmosClient:
             "location.latitude": lat,
             "location.longitude": lng,
             "hours": fetch_hours,
-            "key": self.api_key,
             "unitsSystem": "IMPERIAL",
             "pageSize": fetch_hours,
         }
 
-        resp = requests.get(url, params=params)
-        if not resp.ok:
-            self._handle_error(resp)
-
-        data = resp.json()
-
-        history_items = []
-        entries = data.get("historyHours", [])
-
-        for entry in entries:
-            interval = entry.get("interval", {})
-            ts_str = interval.get("startTime")
-            if not ts_str:
-                continue
-
-            ts = datetime.fromisoformat(ts_str.replace("Z", "+00:00"))
-            temp, feels_like, wind, precip, desc, humidity, pressure = (
-                self._parse_condition(entry)
-            )
-
-            item = HourlyHistoryItem(
-                timestamp=ts,
-                temperature=temp,
-                feels_like=feels_like,
-                humidity=humidity,
-                description=desc,
-                wind=wind,
-                precipitation=precip,
-                pressure=pressure,
-            )
-            history_items.append(item)
-
-        return history_items
+        data = self._get_json(url, params)
+        return self._parse_hours(data.get("historyHours", []), HourlyHistoryItem)
 
     def get_hourly_forecast(
         self, location: str, hours: int = 24
     ) -> List[HourlyForecastItem]:
-        """Fetches hourly forecast."""
-        lat, lng = self.get_coords(location)
+        """Fetches hourly forecast for the next N hours (max 240).
+
+        The API serves at most 24 hours per page, so longer windows follow
+        nextPageToken until the requested hours are covered.
+        """
+        return self._hourly_forecast_at(*self.get_coords(location), hours)
+
+    def _hourly_forecast_at(
+        self, lat: float, lng: float, hours: int
+    ) -> List[HourlyForecastItem]:
         url = f"{self.base_url}/forecast/hours:lookup"
+        fetch_hours = min(hours, 240)
 
         params = {
             "location.latitude": lat,
             "location.longitude": lng,
-            "hours": min(hours, 240),
-            "key": self.api_key,
+            "hours": fetch_hours,
             "unitsSystem": "IMPERIAL",
             "pageSize": min(hours, 24),
         }
 
-        resp = requests.get(url, params=params)
-        if not resp.ok:
-            self._handle_error(resp)
+        data = self._get_json(url, params)
+        # The common single-page case parses the cached list in place; only
+        # multi-page windows build a new (concatenated) list.
+        entries = data.get("forecastHours") or []
+        token = data.get("nextPageToken")
+        while token and len(entries) < fetch_hours:
+            data = self._get_json(url, {**params, "pageToken": token})
+            entries = entries + (data.get("forecastHours") or [])
+            token = data.get("nextPageToken")
+
+        if len(entries) > fetch_hours:
+            entries = entries[:fetch_hours]
+        return self._parse_hours(entries, HourlyForecastItem)
+
+    def _parse_day(
+        self, entry: Dict[str, Any], include_astronomy: bool = True
+    ) -> Optional[DailyForecastItem]:
+        """Builds one DailyForecastItem, or None if the entry has no start time.
+
+        With include_astronomy=False the sun/moon rise and set times are left
+        as None (the moon phase is still read).
+        """
+        ts_str = _dig(entry, "interval", "startTime")
+        if not ts_str:
+            return None
+
+        date = _parse_rfc3339(ts_str)
+
+        low_temp = Temperature(
+            float(_dig(entry, "minTemperature", "degrees", default=0.0)),
+            _dig(entry, "minTemperature", "unit", default="CELSIUS"),
+        )
+        high_temp = Temperature(
+            float(_dig(entry, "maxTemperature", "degrees", default=0.0)),
+            _dig(entry, "maxTemperature", "unit", default="CELSIUS"),
+        )
 
-        data = resp.json()
-        entries = data.get("forecastHours", [])
+        target = entry.get("daytimeForecast") or entry.get("nighttimeForecast")
 
-        items = []
-        for entry in entries:
-            interval = entry.get("interval", {})
-            ts_str = interval.get("startTime")
-            if not ts_str:
-                continue
+        desc = _dig(target, "weatherCondition", "description", "text")
+        if desc is None:
+            desc = _dig(target, "weatherCondition", "type", default="Unknown")
 
-            ts = datetime.fromisoformat(ts_str.replace("Z", "+00:00"))
-            temp, feels_like, wind, precip, desc, humidity, pressure = (
-                self._parse_condition(entry)
-            )
+        prob = _dig(target, "precipitation", "probability", "percent", default=0.0)
+        cloud_cover = _dig(target, "cloudCover", default=0)
 
-            items.append(
-                HourlyForecastItem(
-                    timestamp=ts,
-                    temperature=temp,
-                    feels_like=feels_like,
-                    humidity=humidity,
-                    description=desc,
-                    wind=wind,
-                    precipitation=precip,
-                    pressure=pressure,
-                )
-            )
-        return items
+        # Wind parsing
+        max_wind = Wind(
+            float(_dig(target, "wind", "speed", "value", default=0.0)),
+            _dig(target, "wind", "direction", "cardinal", default="N"),
+            float(_dig(target, "wind", "gust", "value", default=0.0)),
+        )
+
+        # Moon Parsing
+        moon_obj = entry.get("moonEvents") or _EMPTY
+        moon_phase = moon_obj.get("moonPhase", "Unknown")
+
+        sunrise = sunset = moonrise = moonset = None
+        if include_astronomy:
+            sunrise_str = _dig(entry, "sunEvents", "sunriseTime")
+            sunset_str = _dig(entry, "sunEvents", "sunsetTime")
+
+            sunrise = _parse_rfc3339(sunrise_str) if sunrise_str else None
+            sunset = _parse_rfc3339(sunset_str) if sunset_str else None
+
+            moonrise_list = moon_obj.get("moonriseTimes")
+            moonrise = _parse_rfc3339(moonrise_list[0]) if moonrise_list else None
+
+            moonset_list = moon_obj.get("moonsetTimes")
+            moonset = _parse_rfc3339(moonset_list[0]) if moonset_list else None
+
+        # Fields are already typed here; skip pydantic validation.
+        return DailyForecastItem.model_construct(
+            date=date,
+            low_temp=low_temp,
+            high_temp=high_temp,
+            description=desc,
+            precipitation_probability=float(prob),
+            sunrise=sunrise,
+            sunset=sunset,
+            moon_phase=moon_phase,
+            moonrise=moonrise,
+            moonset=moonset,
+            cloud_cover=int(cloud_cover),
+            max_wind=max_wind,
+        )
 
     def get_daily_forecast(
-        self, location: str, days: int = 5
+        self, location: str, days: int = 5, include_astronomy: bool = True
     ) -> List[DailyForecastItem]:
-        """Fetches daily forecast."""
+        """Fetches daily forecast.
+
+        Pass include_astronomy=False to skip parsing sun/moon rise and set
+        times when only the weather fields are needed.
+        """
         lat, lng = self.get_coords(location)
+        return self._daily_forecast_at(lat, lng, days, include_astronomy)
+
+    def _daily_forecast_at(
+        self, lat: float, lng: float, days: int, include_astronomy: bool = True
+    ) -> List[DailyForecastItem]:
         url = f"{self.base_url}/forecast/days:lookup"
 
         params = {
@@ -278,113 +486,51 @@ class AtmosClient:
             "location.longitude": lng,
             "days": min(days, 10),
             "pageSize": min(days, 10),  # Added pageSize
-            "key": self.api_key,
             "unitsSystem": "IMPERIAL",
         }
 
-        resp = requests.get(url, params=params)
-        if not resp.ok:
-            self._handle_error(resp)
-
-        data = resp.json()
+        data = self._get_json(url, params)
         entries = data.get("forecastDays", [])
+        parse = partial(self._parse_day, include_astronomy=include_astronomy)
+        return [item for item in map(parse, entries) if item is not None]
+
+    def get_dashboard(
+        self, location: str, hours: int = 24, days: int = 5
+    ) -> WeatherDashboard:
+        """Fetches current, history, hourly and daily data concurrently."""
+        # One geocode for the whole dashboard, then the four weather calls.
+        lat, lng = self.get_coords(location)
 
-        items = []
-        for entry in entries:
-            interval = entry.get("interval", {})
-            ts_str = interval.get("startTime")
-            if not ts_str:
-                continue
-
-            date = datetime.fromisoformat(ts_str.replace("Z", "+00:00"))
-
-            low_obj = entry.get("minTemperature", {})
-            high_obj = entry.get("maxTemperature", {})
-
-            low_temp = Temperature(
-                value=low_obj.get("degrees", 0.0), units=low_obj.get("unit", "CELSIUS")
-            )
-            high_temp = Temperature(
-                value=high_obj.get("degrees", 0.0),
-                units=high_obj.get("unit", "CELSIUS"),
-            )
-
-            day_forecast = entry.get("daytimeForecast")
-            night_forecast = entry.get("nighttimeForecast")
-            target_forecast = day_forecast or night_forecast or {}
-
-            cond_obj = target_forecast.get("weatherCondition", {})
-            desc_obj = cond_obj.get("description", {})
-            desc = desc_obj.get("text", cond_obj.get("type", "Unknown"))
-
-            day_precip = target_forecast.get("precipitation", {})
-            prob = day_precip.get("probability", {}).get("percent", 0.0)
-
-            cloud_cover = target_forecast.get("cloudCover", 0)
-
-            # Wind parsing
-            wind_obj = target_forecast.get("wind", {})
-            speed_obj = wind_obj.get("speed", {})
-            gust_obj = wind_obj.get("gust", {})
-            direction_obj = wind_obj.get("direction", {})
-
-            max_wind = Wind(
-                speed=speed_obj.get("value", 0.0),
-                direction=direction_obj.get("cardinal", "N"),
-                gust=gust_obj.get("value", 0.0),
-            )
-
-            sun_obj = entry.get("sunEvents", {})
-            sunrise_str = sun_obj.get("sunriseTime")
-            sunset_str = sun_obj.get("sunsetTime")
-
-            sunrise = (
-                datetime.fromisoformat(sunrise_str.replace("Z", "+00:00"))
-                if sunrise_str
-                else None
-            )
-            sunset = (
-                datetime.fromisoformat(sunset_str.replace("Z", "+00:00"))
-                if sunset_str
-                else None
-            )
-
-            # Moon Parsing
-            moon_obj = entry.get("moonEvents", {})
-            moon_phase = moon_obj.get("moonPhase", "Unknown")
-
-            moonrise_list = moon_obj.get("moonriseTimes", [])
-            moonrise = (
-                datetime.fromisoformat(moonrise_list[0].replace("Z", "+00:00"))
-                if moonrise_list
-                else None
-            )
-
-            moonset_list = moon_obj.get("moonsetTimes", [])
-            moonset = (
-                datetime.fromisoformat(moonset_list[0].replace("Z", "+00:00"))
-                if moonset_list
-                else None
-            )
-
-            items.append(
-                DailyForecastItem(
-                    date=date,
-                    low_temp=low_temp,
-                    high_temp=high_temp,
-                    description=desc,
-                    precipitation_probability=prob,
-                    sunrise=sunrise,
-                    sunset=sunset,
-                    moon_phase=moon_phase,
-                    moonrise=moonrise,
-                    moonset=moonset,
-                    cloud_cover=cloud_cover,
-                    max_wind=max_wind,
-                )
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            current = pool.submit(self._current_conditions_at, lat, lng)
+            history = pool.submit(self._hourly_history_at, lat, lng, hours)
+            hourly = pool.submit(self._hourly_forecast_at, lat, lng, hours)
+            daily = pool.submit(self._daily_forecast_at, lat, lng, days)
+
+            return WeatherDashboard.model_construct(
+                current=current.result(),
+                history=history.result(),
+                hourly=hourly.result(),
+                daily=daily.result(),
             )
 
-        return items
+    def _parse_alert(self, a: Dict[str, Any]) -> WeatherAlert:
+        """Builds one WeatherAlert from an API alert entry."""
+        start_str = a.get("effective")
+        end_str = a.get("expires")
+
+        # Fields are already typed here; skip pydantic validation.
+        return WeatherAlert.model_construct(
+            headline=a.get("headline", "Alert"),
+            description=a.get("description", ""),
+            type=a.get("event", "Unknown Event"),
+            severity=a.get("severity", "UNKNOWN"),
+            urgency=a.get("urgency", "UNKNOWN"),
+            certainty=a.get("certainty", "UNKNOWN"),
+            start_time=_parse_rfc3339(start_str) if start_str else None,
+            end_time=_parse_rfc3339(end_str) if end_str else None,
+            source=a.get("senderName", "Unknown Source"),
+        )
 
     def get_public_alerts(self, location: str) -> List[WeatherAlert]:
         """Fetches active weather alerts."""
@@ -394,56 +540,27 @@ class AtmosClient:
         params = {
             "location.latitude": lat,
             "location.longitude": lng,
-            "key": self.api_key,
         }
 
-        resp = requests.get(url, params=params)
-        if not resp.ok:
-            self._handle_error(resp)
+        data = self._get_json(url, params)
+        return [self._parse_alert(a) for a in data.get("alerts", [])]
 
-        data = resp.json()
-        alerts_data = data.get("alerts", [])
-
-        items = []
-        for a in alerts_data:
-            headline = a.get("headline", "Alert")
-            desc = a.get("description", "")
-            severity = a.get("severity", "UNKNOWN")
-            urgency = a.get("urgency", "UNKNOWN")
-            certainty = a.get("certainty", "UNKNOWN")
-            event_type = a.get("event", "Unknown Event")
-            source = a.get("senderName", "Unknown Source")
-
-            start_str = a.get("effective")
-            end_str = a.get("expires")
-
-            start = (
-                datetime.fromisoformat(start_str.replace("Z", "+00:00"))
-                if start_str
-                else None
-            )
-            end = (
-                datetime.fromisoformat(end_str.replace("Z", "+00:00"))
-                if end_str
-                else None
-            )
 
-            items.append(
-                WeatherAlert(
-                    headline=headline,
-                    description=desc,
-                    type=event_type,
-                    severity=severity,
-                    urgency=urgency,
-                    certainty=certainty,
-                    start_time=start,
-                    end_time=end,
-                    source=source,
-                )
-            )
+# Shared client, built on first use so importing atmos.core stays cheap and
+# does not require an API key (e.g. for `atmos places` or `--help`).
+_client: Optional[AtmosClient] = None
+
 
-        return items
+def get_client() -> AtmosClient:
+    """Returns the shared AtmosClient, creating it on first use."""
+    global _client
+    if _client is None:
+        _client = AtmosClient()
+    return _client
 
 
-# Global client instance
-client = AtmosClient()
+def __getattr__(name: str) -> Any:
+    # Keeps the old `atmos.core.client` attribute working (PEP 562).
+    if name == "client":
+        return get_client()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
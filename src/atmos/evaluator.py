@@ -1,5 +1,263 @@
-from typing import List, Tuple
-from atmos.models import DailyForecastItem
+import re
+from functools import lru_cache
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+from atmos.models import DailyForecastItem, MoonClass
+
+
+class _Conditions(NamedTuple):
+    """Normalized inputs for one day; temperatures in °F."""
+
+    high: float
+    low: float
+    wind: float
+    precip: float
+    cloud: float
+    moon_phase: Optional[str]
+    moon: Optional[MoonClass]
+
+
+def _always(d: _Conditions) -> bool:
+    return True
+
+
+def _bright_moon(d: _Conditions) -> bool:
+    return d.moon is not None and d.moon >= MoonClass.GIBBOUS
+
+
+def _dark_moon(d: _Conditions) -> bool:
+    return d.moon is not None and d.moon <= MoonClass.CRESCENT
+
+
+# (predicate, penalty, reason template). The penalty is subtracted from the
+# score and the template is formatted with `d`; a None reason adds no note.
+# Fixed reasons (no "{") are appended as-is, sharing one string object.
+# Numbers print as whole units (`z` avoids "-0"), matching the CLI tables.
+_Rule = Tuple[Callable[[_Conditions], bool], int, Optional[str]]
+_Group = Tuple[_Rule, ...]
+
+_BASE_RULES: Tuple[_Group, ...] = (
+    (
+        (lambda d: d.precip > 70, 80, "High rain chance ({d.precip:z.0f}%)"),
+        (lambda d: d.precip > 30, 30, "Chance of rain ({d.precip:z.0f}%)"),
+    ),
+)
+
+_RULES: Dict[str, Tuple[_Group, ...]] = {
+    "hiking": (
+        (
+            (lambda d: d.high > 90, 30, "Hot ({d.high:z.0f}°F)"),
+            (lambda d: 60 < d.high < 80, 0, "Great temp"),
+        ),
+        ((lambda d: d.high < 30, 20, "Cold ({d.high:z.0f}°F)"),),
+        ((lambda d: d.wind > 20, 30, "Windy ({d.wind:z.0f} mph)"),),
+    ),
+    "bbq": (
+        (
+            (lambda d: d.high < 60, 30, "Chilly ({d.high:z.0f}°F)"),
+            (lambda d: d.high > 70, 0, "Warm"),
+        ),
+        ((lambda d: d.precip > 20, 30, "Rain risk"),),
+        ((lambda d: d.wind > 15, 20, "Breezy"),),
+    ),
+    "stargazing": (
+        (
+            (lambda d: d.cloud > 50, 80, "Cloudy ({d.cloud:z.0f}%)"),
+            (lambda d: d.cloud > 20, 30, "Some clouds ({d.cloud:z.0f}%)"),
+            (lambda d: d.cloud < 10, 0, "Clear skies"),
+        ),
+        (
+            (_bright_moon, 40, "Bright Moon ({d.moon_phase})"),
+            (_dark_moon, 0, "Dark sky"),
+        ),
+    ),
+    "beach": (
+        (
+            (lambda d: d.high < 75, 50, "Too cold ({d.high:z.0f}°F)"),
+            (lambda d: d.high > 85, 0, "Hot & Sunny"),
+        ),
+        (
+            (lambda d: d.cloud > 60, 20, "No sun"),
+            (lambda d: d.cloud < 20, 0, "Sunny"),
+        ),
+        ((lambda d: d.wind > 15, 10, "Breezy"),),
+    ),
+    "running": (
+        (
+            (lambda d: d.high > 80, 40, "Heat ({d.high:z.0f}°F)"),
+            (lambda d: d.high > 70, 10, "Warm"),
+            (lambda d: 45 <= d.high <= 65, 0, "Perfect running temp"),
+            (lambda d: d.high < 32, 20, "Freezing"),
+        ),
+        ((lambda d: d.precip > 60, 20, None),),
+    ),
+    "cycling": (
+        (
+            (lambda d: d.wind > 20, 60, "High Wind ({d.wind:z.0f} mph)"),
+            (lambda d: d.wind > 12, 20, "Headwind ({d.wind:z.0f} mph)"),
+            (_always, 0, "Low wind"),
+        ),
+        ((lambda d: d.precip > 20, 40, "Slippery"),),
+    ),
+    "golf": (
+        ((lambda d: d.wind > 15, 40, "Windy"),),
+        ((lambda d: d.precip > 20, 50, "Rain"),),
+        (
+            (lambda d: d.high < 50, 20, "Chilly"),
+            (lambda d: 65 <= d.high <= 85, 0, "Ideal temp"),
+        ),
+    ),
+    "sailing": (
+        (
+            (lambda d: d.wind < 5, 50, "No wind (Calm)"),
+            (lambda d: 10 <= d.wind <= 20, 0, "Perfect wind"),
+            (lambda d: d.wind > 20, 60, "Dangerous Wind ({d.wind:z.0f} mph)"),
+        ),
+        ((lambda d: d.precip > 50, 30, None),),
+        ((lambda d: d.high < 50, 20, "Cold spray"),),
+    ),
+    "skiing": (
+        (
+            (lambda d: d.high > 40, 80, "Slushy ({d.high:z.0f}°F)"),
+            (lambda d: d.high > 32, 40, "Melting"),
+            (lambda d: d.high < 10, 0, "Frigid"),
+            (_always, 0, "Good snow temp"),
+        ),
+        ((lambda d: d.precip > 50 and d.high < 32, -10, "Fresh Powder likely"),),
+    ),
+    "drone": (
+        (
+            (lambda d: d.wind > 15, 100, "Wind unsafe"),
+            (_always, 0, "Stable air"),
+        ),
+        ((lambda d: d.precip > 10, 100, "Rain risk"),),
+        ((lambda d: d.cloud > 90, 20, None),),
+        ((lambda d: d.high < 32, 20, None),),
+    ),
+    "photography": (
+        (
+            (lambda d: d.cloud > 90, 40, "Flat light"),
+            (lambda d: d.cloud == 0, 10, "Harsh light"),
+            (lambda d: 20 <= d.cloud <= 70, 0, "Dramatic sky"),
+        ),
+        ((lambda d: d.precip > 30, 50, "Rain"),),
+    ),
+    "tennis": (
+        ((lambda d: d.wind > 12, 40, "Windy"),),
+        (
+            (lambda d: d.precip > 10, 80, "Wet court"),
+            (lambda d: 60 <= d.high <= 80, 0, "Great weather"),
+        ),
+    ),
+    "camping": (
+        (
+            (lambda d: d.low < 40, 40, "Cold night ({d.low:z.0f}°F)"),
+            (lambda d: d.low > 50, 0, "Mild night"),
+        ),
+        ((lambda d: d.precip > 30, 60, "Rain"),),
+    ),
+    "fishing": (
+        (
+            (lambda d: d.wind > 15, 40, "Choppy water"),
+            (_always, 0, "Calm water"),
+        ),
+        ((lambda d: d.precip > 60, 30, "Heavy rain"),),
+    ),
+    "kayaking": (
+        (
+            (lambda d: d.wind > 20, 80, "Dangerous water ({d.wind:z.0f} mph)"),
+            (lambda d: d.wind > 10, 30, "Choppy ({d.wind:z.0f} mph)"),
+            (_always, 0, "Calm water"),
+        ),
+        (
+            (lambda d: d.high < 50, 40, "Cold water risk ({d.high:z.0f}°F)"),
+            (lambda d: d.high > 70, 0, "Warm air"),
+        ),
+        ((lambda d: d.precip > 40, 30, "Rain"),),
+    ),
+}
+
+# Activities whose score restarts at 100 after the generic rain rules.
+_RESET_AFTER_BASE = frozenset({"stargazing", "sailing", "skiing", "kayaking"})
+
+# Activities with a bonus (negative penalty) rule: a score at 0 can recover,
+# so they are never cut short.
+_HAS_BONUS = frozenset(
+    act
+    for act, groups in _RULES.items()
+    if any(penalty < 0 for group in groups for _, penalty, _ in group)
+)
+
+
+def _apply(
+    groups: Tuple[_Group, ...],
+    d: _Conditions,
+    reasons: List[str],
+    stop_at: Optional[int] = None,
+) -> int:
+    """Applies rule groups to `d`, appending notes; returns the total penalty.
+
+    With stop_at set, returns as soon as the total reaches it.
+    """
+    total = 0
+    append = reasons.append
+    for group in groups:
+        # A group is an if/elif chain: the first matching rule wins.
+        for pred, penalty, reason in group:
+            if pred(d):
+                total += penalty
+                if reason:
+                    append(reason.format(d=d) if "{" in reason else reason)
+                break
+        if stop_at is not None and total >= stop_at:
+            break
+    return total
+
+
+@lru_cache(maxsize=4096)
+def _score_conditions(
+    act: str,
+    known: bool,
+    high: float,
+    low: float,
+    wind: float,
+    precip: float,
+    cloud: float,
+    moon_phase: Optional[str],
+    full: bool = True,
+) -> Tuple[int, Tuple[str, ...]]:
+    """Pure scoring core, memoized on the exact inputs.
+
+    With full=False, rules stop once the score is certain to be 0, so later
+    notes are omitted.
+    """
+    score = 100
+    reasons: List[str] = []
+
+    if not known:
+        reasons.append("Unknown activity (Using generic logic)")
+
+    # Derived from moon_phase (part of the cache key), never cached on the day.
+    moon = MoonClass.from_phase(moon_phase or "")
+    d = _Conditions(high, low, wind, precip, cloud, moon_phase, moon)
+
+    # --- Base Rules ---
+    score -= _apply(_BASE_RULES, d, reasons)
+    # Some activities ignore the generic rain penalty (its notes stay).
+    if act in _RESET_AFTER_BASE:
+        score = 100
+
+    # --- Specific Rules ---
+    stop_at = None if full or act in _HAS_BONUS else score
+    score -= _apply(_RULES.get(act, ()), d, reasons, stop_at)
+
+    # Cap score
+    score = max(0, min(100, score))
+
+    # If perfect score and no reasons, add a generic good one
+    if score == 100 and not reasons:
+        reasons.append("Excellent conditions")
+
+    return score, tuple(reasons)
 
 
 class SuitabilityEvaluator:
@@ -23,31 +281,38 @@ class SuitabilityEvaluator:
         "kayaking": ["kayaking", "kayak", "canoe", "paddling"],
     }
 
-    @staticmethod
-    def evaluate(day: DailyForecastItem, activity: str) -> Tuple[int, List[str]]:
-        """Returns score (0-100) and list of reasons/warnings."""
-        score = 100
-        reasons = []
+    # alias (and canonical name) -> canonical activity, built once
+    _ALIAS_MAP: Dict[str, str] = {
+        a: key for key, aliases in ACTIVITIES.items() for a in (key, *aliases)
+    }
 
-        act = activity.lower()
-        # Resolve alias
-        resolved = False
-        for key, aliases in SuitabilityEvaluator.ACTIVITIES.items():
-            if act == key or act in aliases:
-                act = key
-                resolved = True
-                break
+    # Free-text fallback ("walk in the park"): whole-word aliases, longest first
+    _ALIAS_RE = re.compile(
+        r"\b(?:%s)\b"
+        % "|".join(re.escape(a) for a in sorted(_ALIAS_MAP, key=len, reverse=True))
+    )
 
-        if not resolved:
-            reasons.append("Unknown activity (Using generic logic)")
+    @staticmethod
+    def _resolve(activity: str) -> Tuple[str, bool]:
+        """Maps an activity alias (or text containing one) to (canonical, known?)."""
+        act = activity.lower()
+        canonical = SuitabilityEvaluator._ALIAS_MAP.get(act)
+        if canonical is None:
+            m = SuitabilityEvaluator._ALIAS_RE.search(act)
+            if m is None:
+                return act, False
+            canonical = SuitabilityEvaluator._ALIAS_MAP[m.group(0)]
+        return canonical, True
 
+    @staticmethod
+    def _score(
+        day: DailyForecastItem, act: str, known: bool, full: bool = True
+    ) -> Tuple[int, List[str]]:
+        """Scores one day for an already-resolved activity."""
         precip = day.precipitation_probability or 0.0
 
-        high = day.high_temp.value or 0.0
-        low = day.low_temp.value or 0.0
-        if day.high_temp.units == "CELSIUS":
-            high = (high * 9 / 5) + 32
-            low = (low * 9 / 5) + 32
+        high = day.high_temp.value_f
+        low = day.low_temp.value_f
 
         wind = 0.0
         if day.max_wind:
@@ -55,247 +320,36 @@ class SuitabilityEvaluator:
 
         cloud = day.cloud_cover or 0
 
-        # --- Base Rules ---
-        if precip > 70:
-            score -= 80
-            reasons.append(f"High rain chance ({precip}%)")
-        elif precip > 30:
-            score -= 30
-            reasons.append(f"Chance of rain ({precip}%)")
-        elif precip < 10:
-            pass
-
-        # --- Specific Rules ---
-
-        if act == "hiking":
-            if high > 90:
-                score -= 30
-                reasons.append(f"Hot ({high}°F)")
-            elif high > 60 and high < 80:
-                reasons.append("Great temp")
-
-            if high < 30:
-                score -= 20
-                reasons.append(f"Cold ({high}°F)")
-
-            if wind > 20:
-                score -= 30
-                reasons.append(f"Windy ({wind} mph)")
-
-        elif act == "bbq":
-            if high < 60:
-                score -= 30
-                reasons.append(f"Chilly ({high}°F)")
-            elif high > 70:
-                reasons.append("Warm")
-
-            if precip > 20:
-                score -= 30
-                reasons.append("Rain risk")
-
-            if wind > 15:
-                score -= 20
-                reasons.append("Breezy")
-
-        elif act == "stargazing":
-            score = 100
-            if cloud > 50:
-                score -= 80
-                reasons.append(f"Cloudy ({cloud}%)")
-            elif cloud > 20:
-                score -= 30
-                reasons.append(f"Some clouds ({cloud}%)")
-            elif cloud < 10:
-                reasons.append("Clear skies")
-
-            phase = (day.moon_phase or "").upper()
-            if "FULL" in phase or "GIBBOUS" in phase:
-                score -= 40
-                reasons.append(f"Bright Moon ({day.moon_phase})")
-            elif "NEW" in phase or "CRESCENT" in phase:
-                reasons.append("Dark sky")
-
-        elif act == "beach":
-            if high < 75:
-                score -= 50
-                reasons.append(f"Too cold ({high}°F)")
-            elif high > 85:
-                reasons.append("Hot & Sunny")
-
-            if cloud > 60:
-                score -= 20
-                reasons.append("No sun")
-            elif cloud < 20:
-                reasons.append("Sunny")
-
-            if wind > 15:
-                score -= 10
-                reasons.append("Breezy")
-
-        elif act == "running":
-            if high > 80:
-                score -= 40
-                reasons.append(f"Heat ({high}°F)")
-            elif high > 70:
-                score -= 10
-                reasons.append("Warm")
-            elif high >= 45 and high <= 65:
-                reasons.append("Perfect running temp")
-            elif high < 32:
-                score -= 20
-                reasons.append("Freezing")
-
-            if precip > 60:
-                score -= 20
-
-        elif act == "cycling":
-            if wind > 20:
-                score -= 60
-                reasons.append(f"High Wind ({wind} mph)")
-            elif wind > 12:
-                score -= 20
-                reasons.append(f"Headwind ({wind} mph)")
-            else:
-                reasons.append("Low wind")
-
-            if precip > 20:
-                score -= 40
-                reasons.append("Slippery")
-
-        elif act == "golf":
-            if wind > 15:
-                score -= 40
-                reasons.append("Windy")
-            if precip > 20:
-                score -= 50
-                reasons.append("Rain")
-            if high < 50:
-                score -= 20
-                reasons.append("Chilly")
-            elif high >= 65 and high <= 85:
-                reasons.append("Ideal temp")
-
-        elif act == "sailing":
-            score = 100
-            if wind < 5:
-                score -= 50
-                reasons.append("No wind (Calm)")
-            elif wind >= 10 and wind <= 20:
-                reasons.append("Perfect wind")
-            elif wind > 20:
-                score -= 60
-                reasons.append(f"Dangerous Wind ({wind} mph)")
-
-            if precip > 50:
-                score -= 30
-
-            if high < 50:
-                score -= 20
-                reasons.append("Cold spray")
-
-        elif act == "skiing":
-            score = 100
-            if high > 40:
-                score -= 80
-                reasons.append(f"Slushy ({high}°F)")
-            elif high > 32:
-                score -= 40
-                reasons.append("Melting")
-            elif high < 10:
-                reasons.append("Frigid")
-            else:
-                reasons.append("Good snow temp")
-
-            if precip > 50 and high < 32:
-                score += 10
-                reasons.append("Fresh Powder likely")
-
-        elif act == "drone":
-            if wind > 15:
-                score -= 100
-                reasons.append("Wind unsafe")
-            else:
-                reasons.append("Stable air")
-
-            if precip > 10:
-                score -= 100
-                reasons.append("Rain risk")
-            if cloud > 90:
-                score -= 20
-            if high < 32:
-                score -= 20
-
-        elif act == "photography":
-            if cloud > 90:
-                score -= 40
-                reasons.append("Flat light")
-            elif cloud == 0:
-                score -= 10
-                reasons.append("Harsh light")
-            elif cloud >= 20 and cloud <= 70:
-                reasons.append("Dramatic sky")
-
-            if precip > 30:
-                score -= 50
-                reasons.append("Rain")
-
-        elif act == "tennis":
-            if wind > 12:
-                score -= 40
-                reasons.append("Windy")
-            if precip > 10:
-                score -= 80
-                reasons.append("Wet court")
-            elif high >= 60 and high <= 80:
-                reasons.append("Great weather")
-
-        elif act == "camping":
-            if low < 40:
-                score -= 40
-                reasons.append(f"Cold night ({low}°F)")
-            elif low > 50:
-                reasons.append("Mild night")
-
-            if precip > 30:
-                score -= 60
-                reasons.append("Rain")
-
-        elif act == "fishing":
-            if wind > 15:
-                score -= 40
-                reasons.append("Choppy water")
-            else:
-                reasons.append("Calm water")
-            if precip > 60:
-                score -= 30
-                reasons.append("Heavy rain")
-
-        elif act == "kayaking":
-            score = 100
-            if wind > 20:
-                score -= 80
-                reasons.append(f"Dangerous water ({wind} mph)")
-            elif wind > 10:
-                score -= 30
-                reasons.append(f"Choppy ({wind} mph)")
-            else:
-                reasons.append("Calm water")
-
-            if high < 50:
-                score -= 40
-                reasons.append(f"Cold water risk ({high}°F)")
-            elif high > 70:
-                reasons.append("Warm air")
-
-            if precip > 40:
-                score -= 30
-                reasons.append("Rain")
-
-        # Cap score
-        score = max(0, min(100, score))
-
-        # If perfect score and no reasons, add a generic good one
-        if score == 100 and not reasons:
-            reasons.append("Excellent conditions")
-
-        return score, reasons
+        score, reasons = _score_conditions(
+            act,
+            known,
+            high,
+            low,
+            wind,
+            precip,
+            cloud,
+            day.moon_phase,
+            full,
+        )
+        return score, list(reasons)
+
+    @staticmethod
+    def evaluate(
+        day: DailyForecastItem, activity: str, full: bool = True
+    ) -> Tuple[int, List[str]]:
+        """Returns score (0-100) and list of reasons/warnings.
+
+        Pass full=False to skip the remaining rules (and their notes) once the
+        score is certain to be 0.
+        """
+        act, known = SuitabilityEvaluator._resolve(activity)
+        return SuitabilityEvaluator._score(day, act, known, full)
+
+    @staticmethod
+    def evaluate_batch(
+        days: List[DailyForecastItem], activity: str, full: bool = True
+    ) -> List[Tuple[int, List[str]]]:
+        """Scores many days for one activity, resolving the activity once."""
+        act, known = SuitabilityEvaluator._resolve(activity)
+        score = SuitabilityEvaluator._score
+        return [score(day, act, known, full) for day in days]
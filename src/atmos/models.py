@@ -1,22 +1,65 @@
+from dataclasses import dataclass, field
+from enum import IntEnum
 from pydantic import BaseModel
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 
 # --- Weather Data Models ---
 
 
-class Temperature(BaseModel):
+class MoonClass(IntEnum):
+    """Moon phases ordered by brightness, for integer comparisons."""
+
+    NEW = 0
+    CRESCENT = 1
+    QUARTER = 2
+    GIBBOUS = 3
+    FULL = 4
+
+    @classmethod
+    def from_phase(cls, phase: str) -> Optional["MoonClass"]:
+        """Classifies an API phase name (e.g. "WANING_GIBBOUS"); None if unknown."""
+        p = phase.upper()
+        if "FULL" in p:
+            return cls.FULL
+        if "GIBBOUS" in p:
+            return cls.GIBBOUS
+        if "CRESCENT" in p:
+            return cls.CRESCENT
+        if "NEW" in p:
+            return cls.NEW
+        if "QUARTER" in p:
+            return cls.QUARTER
+        return None
+
+
+# Small value objects built several times per parsed entry. Plain slotted
+# dataclasses skip pydantic validation; the parser supplies typed values.
+
+
+@dataclass(frozen=True, slots=True)
+class Temperature:
     value: Optional[float] = 0.0
     units: Optional[str] = "CELSIUS"
+    # Same reading in °F, computed once; the activity rules compare in °F.
+    value_f: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        value_f = self.value or 0.0
+        if self.units == "CELSIUS":
+            value_f = (value_f * 9 / 5) + 32
+        object.__setattr__(self, "value_f", value_f)
 
 
-class Wind(BaseModel):
+@dataclass(frozen=True, slots=True)
+class Wind:
     speed: Optional[float] = 0.0
     direction: Optional[str] = "N"
     gust: Optional[float] = 0.0
 
 
-class Precipitation(BaseModel):
+@dataclass(frozen=True, slots=True)
+class Precipitation:
     type: Optional[str] = "None"
     rate: Optional[float] = 0.0
     probability: Optional[float] = 0.0
@@ -73,3 +116,10 @@ class WeatherAlert(BaseModel):
     start_time: Optional[datetime] = None
     end_time: Optional[datetime] = None
     source: str
+
+
+class WeatherDashboard(BaseModel):
+    current: CurrentConditions
+    history: List[HourlyHistoryItem]
+    hourly: List[HourlyForecastItem]
+    daily: List[DailyForecastItem]
@@ -1,14 +1,41 @@
 import json
+import os
+import stat
+import tempfile
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Any, Dict, Optional, Tuple
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+except ImportError:  # optional speedup, see the "fast" extra
+    _loads = json.loads  # type: ignore[assignment]
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _umask() -> int:
+    """The process umask (os.umask can only be read by setting it)."""
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
 
 
 class PlacesManager:
     """Manages the ~/.config/atmos/places.json registry."""
 
-    def __init__(self):
-        self.config_dir = Path.home() / ".config/atmos"
-        self.places_file = self.config_dir / "places.json"
+    def __init__(self, places_file: Optional[Path] = None):
+        self.places_file = places_file or Path.home() / ".config/atmos/places.json"
+        self.config_dir = self.places_file.parent
+        # Last decoded places.json and the (st_mtime_ns, st_size) it was read at.
+        self._cache: Optional[Dict[str, str]] = None
+        self._cache_key: Tuple[int, int] = (-1, -1)
         self._ensure_file()
 
     def _ensure_file(self):
@@ -18,17 +45,49 @@ class PlacesManager:
             self._save_places({})
 
     def _load_places(self) -> Dict[str, str]:
-        """Loads places from the JSON file."""
+        """Loads places from the JSON file, reusing the last read if unchanged."""
         try:
-            with open(self.places_file, "r") as f:
-                return json.load(f)
-        except (json.JSONDecodeError, FileNotFoundError):
+            st = self.places_file.stat()
+        except FileNotFoundError:
             return {}
 
+        if self._cache is None or (st.st_mtime_ns, st.st_size) != self._cache_key:
+            try:
+                with open(self.places_file, "rb") as f:
+                    # Key the cache on the file actually read, not the stat above.
+                    st = os.fstat(f.fileno())
+                    places = _loads(f.read())
+            except (ValueError, FileNotFoundError):
+                return {}
+            self._cache, self._cache_key = places, (st.st_mtime_ns, st.st_size)
+
+        # Callers mutate the result (add/remove), so hand out a copy.
+        return dict(self._cache)
+
     def _save_places(self, places: Dict[str, str]):
-        """Saves places to the JSON file."""
-        with open(self.places_file, "w") as f:
-            json.dump(places, f, indent=4)
+        """Saves places to the JSON file.
+
+        Writes a sibling temp file and renames it over places.json, so readers
+        never see a half-written registry. A symlinked places.json is followed
+        (the link stays), and the file keeps its mode rather than mkstemp's 0600.
+        """
+        target = self.places_file.resolve()
+        try:
+            mode = stat.S_IMODE(target.stat().st_mode)
+        except FileNotFoundError:
+            mode = 0o666 & ~_umask()
+
+        fd, tmp = tempfile.mkstemp(dir=target.parent, prefix=".places-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(_dumps(places))
+            os.chmod(tmp, mode)
+            os.replace(tmp, target)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        st = self.places_file.stat()
+        self._cache, self._cache_key = dict(places), (st.st_mtime_ns, st.st_size)
 
     def add(self, name: str, address: str):
         """Adds or updates a place."""
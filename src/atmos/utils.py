@@ -1,5 +1,29 @@
 from datetime import datetime
 
+from atmos.models import MoonClass
+
+_WINTER = "Orion, Taurus, Gemini, Canis Major"
+_SPRING = "Leo, Virgo, Ursa Major (Big Dipper)"
+_SUMMER = "Scorpius, Cygnus, Lyra, Aquila"
+_FALL = "Pegasus, Andromeda, Cassiopeia"
+
+# Pre-joined constellation lists indexed by month (1-12); index 0 is unused.
+_CONSTELLATIONS_BY_MONTH = (
+    "",
+    _WINTER,
+    _WINTER,
+    _SPRING,
+    _SPRING,
+    _SPRING,
+    _SUMMER,
+    _SUMMER,
+    _SUMMER,
+    _FALL,
+    _FALL,
+    _FALL,
+    _WINTER,
+)
+
 
 def format_temp(temp: float) -> str:
     return f"{temp}°C"
@@ -19,23 +43,14 @@ def get_stargazing_conditions(cloud_cover_percent: float, moon_phase: str) -> st
 
     # Moon impact
     moon_impact = ""
-    if "FULL" in moon_phase.upper() or "GIBBOUS" in moon_phase.upper():
+    moon = MoonClass.from_phase(moon_phase)
+    if moon is not None and moon >= MoonClass.GIBBOUS:
         moon_impact = " (Bright Moon)"
         if rating == "Excellent":
             rating = "Good"  # Downgrade due to light pollution
 
     # 2. Seasonality (Northern Hemisphere Default)
     # Simple static lookup based on current month
-    month = datetime.now().month
-    constellations = []
-
-    if month in [12, 1, 2]:  # Winter
-        constellations = ["Orion", "Taurus", "Gemini", "Canis Major"]
-    elif month in [3, 4, 5]:  # Spring
-        constellations = ["Leo", "Virgo", "Ursa Major (Big Dipper)"]
-    elif month in [6, 7, 8]:  # Summer
-        constellations = ["Scorpius", "Cygnus", "Lyra", "Aquila"]
-    else:  # Fall
-        constellations = ["Pegasus", "Andromeda", "Cassiopeia"]
-
-    return f"{rating}{moon_impact}. Look for: {', '.join(constellations)}."
+    constellations = _CONSTELLATIONS_BY_MONTH[datetime.now().month]
+
+    return f"{rating}{moon_impact}. Look for: {constellations}."
@@ -0,0 +1,144 @@
+import signal
+from types import SimpleNamespace
+from urllib.parse import urlsplit
+
+import pytest
+import requests
+from click.testing import CliRunner
+from requests.adapters import BaseAdapter
+import atmos.core
+from atmos.cli import main
+from atmos.core import AtmosClient, _parse_rfc3339
+from atmos.evaluator import _score_conditions
+from atmos.models import CurrentConditions, Temperature, Wind, Precipitation
+from atmos.places import places_manager
+
+
+class StubAdapter(BaseAdapter):
+    """Transport adapter serving canned bodies by URL path (404 otherwise)."""
+
+    def __init__(self, routes):
+        super().__init__()
+        self.routes = routes
+        self.calls = []
+
+    def send(self, request, **kwargs):
+        self.calls.append(request)
+        body = self.routes.get(urlsplit(request.url).path)
+        resp = requests.Response()
+        resp.status_code = 404 if body is None else 200
+        resp._content = b"" if body is None else body
+        resp.url = request.url
+        resp.request = request
+        return resp
+
+    def close(self):
+        pass
+
+
+@pytest.fixture(autouse=True)
+def _reset_caches(monkeypatch):
+    """Starts each test with empty memo caches and a fresh shared client."""
+    _parse_rfc3339.cache_clear()
+    _score_conditions.cache_clear()
+    monkeypatch.setattr(atmos.core, "_client", None)
+    monkeypatch.setattr(places_manager, "_cache", None)
+
+
+@pytest.fixture(scope="session")
+def dummy_weather():
+    """Current conditions shared by the CLI tests (treat as read-only)."""
+    return CurrentConditions.model_construct(
+        temperature=Temperature(value=20.0),
+        feels_like=Temperature(value=18.0),
+        humidity=50.0,
+        description="Test Sunny",
+        wind=Wind(speed=10.0, direction="N"),
+        precipitation=Precipitation(),
+        uv_index=3,
+        visibility=10000.0,
+        pressure=1010.0,
+    )
+
+
+@pytest.fixture(scope="session")
+def runner():
+    return CliRunner()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_click(runner):
+    """Pays Click/rich first-use setup once, not in whichever CLI test runs first."""
+    runner.invoke(main, ["--help"])
+
+
+@pytest.fixture
+def invoke(runner):
+    """Runs `atmos <args>`, failing the test if it runs past `timeout` seconds.
+
+    A stray real network call (e.g. a patch target that drifted) then fails
+    fast instead of stalling the run. The deadline is a SIGALRM timer, so the
+    command is interrupted in place: no thread outlives the test, and
+    CliRunner restores stdout/stdin as it unwinds. pytest.fail raises a
+    BaseException, which the commands' `except Exception` handlers let
+    through; other errors are re-raised rather than kept on the result.
+    Platforms without SIGALRM (Windows) run the command with no deadline.
+    """
+
+    def _invoke(args, timeout=5.0):
+        if not hasattr(signal, "SIGALRM"):
+            return runner.invoke(main, args, catch_exceptions=False)
+
+        def on_timeout(signum, frame):
+            pytest.fail(f"atmos {args} did not finish within {timeout}s")
+
+        previous = signal.signal(signal.SIGALRM, on_timeout)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+        try:
+            return runner.invoke(main, args, catch_exceptions=False)
+        finally:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous)
+
+    return _invoke
+
+
+@pytest.fixture
+def patched_client(mocker, dummy_weather):
+    """Stubs the shared client's fetchers; tests adjust the returned mocks."""
+    return SimpleNamespace(
+        current=mocker.patch(
+            "atmos.core.client.get_current_conditions", return_value=dummy_weather
+        ),
+        hourly=mocker.patch("atmos.core.client.get_hourly_forecast", return_value=[]),
+        daily=mocker.patch("atmos.core.client.get_daily_forecast", return_value=[]),
+    )
+
+
+@pytest.fixture(scope="session")
+def _shared_client():
+    return AtmosClient()
+
+
+@pytest.fixture
+def atmos_client(_shared_client):
+    """The session's AtmosClient, with its geocode/response caches emptied."""
+    _shared_client._geo_cache.clear()
+    _shared_client._response_cache.clear()
+    return _shared_client
+
+
+@pytest.fixture
+def stub_api():
+    """Builds an AtmosClient whose HTTP calls are answered from `routes`.
+
+    Returns (client, adapter); adapter.calls records the prepared requests.
+    """
+
+    def make(routes):
+        client = AtmosClient()
+        adapter = StubAdapter(routes)
+        client._session.mount("https://", adapter)
+        return client, adapter
+
+    return make
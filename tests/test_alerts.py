@@ -1,32 +1,32 @@
+import json
 from atmos.core import AtmosClient
 from atmos.models import WeatherAlert
 
 
-def test_get_alerts(mocker):
-    mocker.patch.object(AtmosClient, "get_coords", return_value=(40.7128, -74.0060))
-    mock_get = mocker.patch("requests.get")
-    mock_response = mocker.Mock()
+def test_get_alerts(stub_api, monkeypatch):
+    monkeypatch.setattr(
+        AtmosClient, "get_coords", lambda self, location: (40.7128, -74.0060)
+    )
 
     # Simulated Alert Response
-    mock_response.json.return_value = {
-        "alerts": [
-            {
-                "headline": "Severe Thunderstorm Watch",
-                "description": "Conditions are favorable for severe thunderstorms.",
-                "severity": "SEVERE",
-                "urgency": "IMMEDIATE",
-                "certainty": "LIKELY",
-                "event": "Severe Thunderstorm",
-                "senderName": "NWS",
-                "effective": "2023-10-06T12:00:00Z",
-                "expires": "2023-10-06T18:00:00Z",
-            }
-        ]
-    }
-    mock_response.ok = True
-    mock_get.return_value = mock_response
-
-    client = AtmosClient()
+    body = json.dumps(
+        {
+            "alerts": [
+                {
+                    "headline": "Severe Thunderstorm Watch",
+                    "description": "Conditions are favorable for severe thunderstorms.",
+                    "severity": "SEVERE",
+                    "urgency": "IMMEDIATE",
+                    "certainty": "LIKELY",
+                    "event": "Severe Thunderstorm",
+                    "senderName": "NWS",
+                    "effective": "2023-10-06T12:00:00Z",
+                    "expires": "2023-10-06T18:00:00Z",
+                }
+            ]
+        }
+    ).encode()
+    client, _ = stub_api({"/v1/publicAlerts:lookup": body})
     alerts = client.get_public_alerts("New York")
 
     assert len(alerts) == 1
@@ -1,3 +1,4 @@
+from atmos.models import MoonClass
 from atmos.utils import get_stargazing_conditions
 
 
@@ -17,3 +18,10 @@ def test_stargazing_logic():
 
     # Seasonality check (simple existence)
     assert "Look for:" in res
+
+
+def test_moon_class_from_phase():
+    assert MoonClass.from_phase("WANING_GIBBOUS") is MoonClass.GIBBOUS
+    assert MoonClass.from_phase("first_quarter") is MoonClass.QUARTER
+    assert MoonClass.from_phase("NEW_MOON") < MoonClass.FULL
+    assert MoonClass.from_phase("MOON_PHASE_UNSPECIFIED") is None
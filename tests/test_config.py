@@ -0,0 +1,34 @@
+import os
+import subprocess
+import sys
+
+from atmos.config import settings
+
+
+def test_import_and_places_work_without_api_key(tmp_path):
+    """Nothing builds the API client until a command actually needs it."""
+    env = {k: v for k, v in os.environ.items() if k != "GOOGLE_MAPS_API_KEY"}
+    env["HOME"] = str(tmp_path)  # no ~/.config/atmos/.env, fresh places.json
+    code = "import atmos.core; from atmos.cli import main; main(['places', 'list'])"
+
+    proc = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=tmp_path,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=30,
+    )
+
+    assert proc.returncode == 0, proc.stderr
+    assert "No places saved." in proc.stdout
+
+
+def test_missing_api_key_is_reported_by_the_command(monkeypatch, invoke):
+    monkeypatch.setattr(settings, "GOOGLE_MAPS_API_KEY", "")
+
+    result = invoke(["current", "-L", "Paris"])
+
+    assert result.exit_code == 0
+    assert result.exception is None
+    assert "GOOGLE_MAPS_API_KEY is not set" in result.output
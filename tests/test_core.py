@@ -1,29 +1,29 @@
-from atmos.core import AtmosClient
+import json
+import time
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from datetime import datetime
+from types import SimpleNamespace
+from atmos.core import AtmosClient, _parse_rfc3339
 from atmos.models import DailyForecastItem
 
+NYC = (40.7128, -74.0060)
 
-def test_get_coords(mocker):
-    mock_get = mocker.patch("requests.get")
-    mock_response = mocker.Mock()
-    mock_response.json.return_value = {
-        "results": [{"geometry": {"location": {"lat": 40.7128, "lng": -74.0060}}}]
-    }
-    mock_response.ok = True
-    mock_get.return_value = mock_response
-
-    client = AtmosClient()
-    lat, lng = client.get_coords("New York")
-    assert lat == 40.7128
+# URL paths routed by the stub_api fixture.
+GEOCODE_PATH = "/maps/api/geocode/json"
+DAILY_PATH = "/v1/forecast/days:lookup"
+HOURLY_PATH = "/v1/forecast/hours:lookup"
+CURRENT_PATH = "/v1/currentConditions:lookup"
 
+# Raw API bodies, encoded once; bytes keep the shared payloads immutable.
+GEOCODE_BODY = json.dumps(
+    {"results": [{"geometry": {"location": {"lat": 40.7128, "lng": -74.0060}}}]}
+).encode()
 
-def test_get_forecast(mocker):
-    """Test fetching daily forecast."""
-    mocker.patch.object(AtmosClient, "get_coords", return_value=(40.7128, -74.0060))
-    mock_get = mocker.patch("requests.get")
-    mock_response = mocker.Mock()
-
-    # Simulated Forecast Response
-    mock_response.json.return_value = {
+# Simulated daily forecast response
+DAILY_BODY = json.dumps(
+    {
         "forecastDays": [
             {
                 "interval": {"startTime": "2023-10-06T00:00:00Z"},
@@ -40,10 +40,146 @@ def test_get_forecast(mocker):
             }
         ]
     }
-    mock_response.ok = True
-    mock_get.return_value = mock_response
+).encode()
+
+# Simulated hourly forecast response
+HOURLY_BODY = json.dumps(
+    {
+        "forecastHours": [
+            {
+                "interval": {"startTime": "2023-10-06T12:00:00Z"},
+                "temperature": {"degrees": 55.0},
+                "weatherCondition": {"description": {"text": "Cloudy"}},
+            }
+        ]
+    }
+).encode()
+
+# Current conditions: the newer flat payload in both unit systems, and the
+# legacy shape wrapped in a "currentConditions" object.
+CURRENT_METRIC = {
+    "temperature": {"degrees": 15.5, "unit": "CELSIUS"},
+    "feelsLikeTemperature": {"degrees": 14.0, "unit": "CELSIUS"},
+    "weatherCondition": {"description": {"text": "Clear"}},
+    "wind": {"speed": {"value": 12.0}, "direction": {"cardinal": "NW"}},
+    "uvIndex": 4,
+}
+CURRENT_IMPERIAL = {
+    **CURRENT_METRIC,
+    "temperature": {"degrees": 60.5, "unit": "FAHRENHEIT"},
+    "feelsLikeTemperature": {"degrees": 57.0, "unit": "FAHRENHEIT"},
+}
+CURRENT_LEGACY = {"currentConditions": CURRENT_METRIC}
+
+
+def stub_response(body, status=200):
+    """A minimal stand-in for requests.Response, as read by AtmosClient."""
+    return SimpleNamespace(
+        content=body, ok=status < 400, status_code=status, text=body.decode()
+    )
+
+
+@pytest.mark.parametrize(
+    "body, outcome",
+    [
+        (GEOCODE_BODY, nullcontext()),
+        (b'{"results": []}', pytest.raises(ValueError, match="Location not found")),
+    ],
+    ids=["found", "not-found"],
+)
+def test_get_coords(stub_api, body, outcome):
+    client, _ = stub_api({GEOCODE_PATH: body})
+    with outcome:
+        assert client.get_coords("New York") == NYC
 
-    client = AtmosClient()
+
+def test_get_coords_cached(stub_api):
+    """Repeat lookups for the same place skip the geocoding call."""
+    client, adapter = stub_api({GEOCODE_PATH: GEOCODE_BODY})
+    assert client.get_coords("New York") == NYC
+    assert client.get_coords("  new york ") == NYC
+    assert len(adapter.calls) == 1
+
+
+@pytest.mark.parametrize(
+    "payload, expected_temp, expected_units",
+    [
+        (CURRENT_LEGACY, 15.5, "CELSIUS"),
+        (CURRENT_METRIC, 15.5, "CELSIUS"),
+        (CURRENT_IMPERIAL, 60.5, "FAHRENHEIT"),
+    ],
+    ids=["legacy", "metric", "imperial"],
+)
+def test_get_current_conditions(stub_api, payload, expected_temp, expected_units):
+    body = json.dumps(payload).encode()
+    client, _ = stub_api({GEOCODE_PATH: GEOCODE_BODY, CURRENT_PATH: body})
+    current = client.get_current_conditions("London")
+
+    assert current.temperature.value == expected_temp
+    assert current.temperature.units == expected_units
+    assert current.description == "Clear"
+    assert current.wind.direction == "NW"
+    assert current.uv_index == 4
+
+
+def test_get_current_conditions_null_fields(stub_api):
+    """Explicit JSON nulls fall back to the field defaults."""
+    body = json.dumps(
+        {
+            "relativeHumidity": None,
+            "airPressure": {"meanSeaLevelMillibars": None},
+            "uvIndex": None,
+            "visibility": {"distance": None},
+            "temperature": {"degrees": None, "unit": "CELSIUS"},
+            "feelsLikeTemperature": {"degrees": None},
+            "wind": {"speed": {"value": None}, "gust": {"value": None}},
+            "precipitation": {"probability": {"percent": None}, "qpf": {}},
+        }
+    ).encode()
+    client, _ = stub_api({GEOCODE_PATH: GEOCODE_BODY, CURRENT_PATH: body})
+    current = client.get_current_conditions("London")
+
+    assert (current.humidity, current.pressure) == (0.0, 1013.25)
+    assert (current.uv_index, current.visibility) == (0, 10.0)
+    assert current.temperature.value == current.feels_like.value == 0.0
+    assert (current.wind.speed, current.wind.gust) == (0.0, 0.0)
+    assert current.precipitation.probability == 0.0
+
+
+def test_parse_day_null_fields(atmos_client):
+    day = atmos_client._parse_day(
+        {
+            "interval": {"startTime": "2023-10-06T00:00:00Z"},
+            "maxTemperature": {"degrees": None},
+            "daytimeForecast": {
+                "wind": {"speed": {"value": None}},
+                "precipitation": {"probability": {"percent": None}},
+                "cloudCover": None,
+            },
+        }
+    )
+    assert day.high_temp.value == day.max_wind.speed == 0.0
+    assert (day.precipitation_probability, day.cloud_cover) == (0.0, 0)
+
+
+def test_geocode_cache_is_bounded(monkeypatch, stub_api):
+    """Once full, geocoding a new place evicts the oldest one."""
+    monkeypatch.setattr("atmos.core._GEOCODE_CACHE_SIZE", 2)
+    client, _ = stub_api({GEOCODE_PATH: GEOCODE_BODY})
+    for place in ("London", "Paris", "Rome"):
+        client.get_coords(place)
+
+    assert list(client._geo_cache) == ["paris", "rome"]
+
+
+def test_parse_rfc3339():
+    for ts in ("2023-10-06T12:00:00Z", "2023-10-06T12:00:00.5Z"):
+        assert _parse_rfc3339(ts) == datetime.fromisoformat(ts.replace("Z", "+00:00"))
+
+
+def test_get_forecast(stub_api):
+    """Test fetching daily forecast."""
+    client, _ = stub_api({GEOCODE_PATH: GEOCODE_BODY, DAILY_PATH: DAILY_BODY})
     forecast = client.get_daily_forecast("London", days=1)
 
     assert len(forecast) == 1
@@ -52,27 +188,109 @@ def test_get_forecast(mocker):
     assert forecast[0].description == "Sunny"
     assert forecast[0].sunrise.hour == 6
 
+    forecast = client.get_daily_forecast("London", days=1, include_astronomy=False)
+    assert forecast[0].sunrise is None
+    assert forecast[0].description == "Sunny"
 
-def test_get_hourly_forecast(mocker):
-    mocker.patch.object(AtmosClient, "get_coords", return_value=(40.7128, -74.0060))
-    mock_get = mocker.patch("requests.get")
-    mock_response = mocker.Mock()
-
-    # Simulated Hourly Response
-    mock_response.json.return_value = {
-        "forecastHours": [
-            {
-                "interval": {"startTime": "2023-10-06T12:00:00Z"},
-                "temperature": {"degrees": 55.0},
-                "weatherCondition": {"description": {"text": "Cloudy"}},
-            }
-        ]
-    }
-    mock_response.ok = True
-    mock_get.return_value = mock_response
 
-    client = AtmosClient()
+def test_get_hourly_forecast(stub_api):
+    client, adapter = stub_api({GEOCODE_PATH: GEOCODE_BODY, HOURLY_PATH: HOURLY_BODY})
     items = client.get_hourly_forecast("London", hours=1)
 
     assert len(items) == 1
     assert items[0].temperature.value == 55.0
+    assert "location.latitude=40.7128" in adapter.calls[-1].url
+
+
+def test_get_hourly_forecast_pages(mocker, monkeypatch, atmos_client):
+    """Windows longer than one 24-hour page follow nextPageToken."""
+    monkeypatch.setattr(AtmosClient, "get_coords", lambda self, location: NYC)
+    mock_get = mocker.patch.object(atmos_client._session, "get")
+
+    def page(day, token=None):
+        body = {
+            "forecastHours": [
+                {"interval": {"startTime": f"2023-10-{day:02d}T{h:02d}:00:00Z"}}
+                for h in range(24)
+            ]
+        }
+        if token:
+            body["nextPageToken"] = token
+        return stub_response(json.dumps(body).encode())
+
+    mock_get.side_effect = [page(6, "p2"), page(7)]
+
+    items = atmos_client.get_hourly_forecast("London", hours=48)
+
+    assert len(items) == 48
+    assert items[-1].timestamp.day == 7
+    assert mock_get.call_args.kwargs["params"]["pageToken"] == "p2"
+
+
+def test_get_dashboard(mocker, monkeypatch, atmos_client):
+    """Dashboard resolves the location once and gathers all four views."""
+    coords = mocker.patch.object(AtmosClient, "get_coords", return_value=NYC)
+    current = mocker.patch.object(AtmosClient, "_current_conditions_at")
+    monkeypatch.setattr(AtmosClient, "_hourly_history_at", lambda *args: [])
+    monkeypatch.setattr(AtmosClient, "_hourly_forecast_at", lambda *args: [])
+    daily = mocker.patch.object(AtmosClient, "_daily_forecast_at", return_value=[])
+
+    dash = atmos_client.get_dashboard("London", days=3)
+
+    coords.assert_called_once_with("London")
+    daily.assert_called_once_with(40.7128, -74.0060, 3)
+    assert dash.current is current.return_value
+    assert dash.hourly == []
+
+
+def test_stale_payload_served_on_transient_error(mocker, monkeypatch, atmos_client):
+    """A 503 after retries falls back to the last good (expired) payload."""
+    monkeypatch.setattr(AtmosClient, "get_coords", lambda self, location: NYC)
+    client = atmos_client
+    mock_get = mocker.patch.object(client._session, "get")
+    mock_get.side_effect = [stub_response(b'{"alerts": []}'), stub_response(b"", 503)]
+
+    assert client.get_public_alerts("London") == []
+
+    # Expire the cached payload so the next call goes to the network.
+    cache = client._response_cache
+    cache.update({key: (0.0, payload) for key, (_, payload) in cache.items()})
+    assert client.get_public_alerts("London") == []
+    assert mock_get.call_count == 2
+
+
+def test_response_cache_is_bounded(mocker, monkeypatch, atmos_client):
+    """Once full, storing a new payload evicts the oldest one."""
+    monkeypatch.setattr("atmos.core._RESPONSE_CACHE_SIZE", 2)
+    mocker.patch.object(atmos_client._session, "get", return_value=stub_response(b"{}"))
+    for token in ("a", "b", "c"):
+        atmos_client._get_json("https://example.test", {"pageToken": token})
+
+    assert [dict(params) for _, params in atmos_client._response_cache] == [
+        {"pageToken": "b"},
+        {"pageToken": "c"},
+    ]
+
+
+class _YieldingDict(dict):
+    """Dict that gives up the GIL between picking a key to evict and deleting it."""
+
+    def __delitem__(self, key):
+        time.sleep(0.001)
+        super().__delitem__(key)
+
+
+def test_response_cache_trim_is_thread_safe(mocker, monkeypatch, atmos_client):
+    """Concurrent stores into a full cache never evict the same key twice."""
+    monkeypatch.setattr("atmos.core._RESPONSE_CACHE_SIZE", 4)
+    monkeypatch.setattr(atmos_client, "_response_cache", _YieldingDict())
+    mocker.patch.object(atmos_client._session, "get", return_value=stub_response(b"{}"))
+
+    def fetch(worker):
+        for i in range(25):
+            atmos_client._get_json("https://example.test", {"page": (worker, i)})
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(fetch, range(4)))  # re-raises any worker error
+
+    assert len(atmos_client._response_cache) == 4
@@ -1,15 +1,14 @@
-from click.testing import CliRunner
-from atmos.cli import main
 from atmos.models import HourlyForecastItem, Temperature, Wind, Precipitation
 from datetime import datetime
+from types import SimpleNamespace
 
 
-def test_default_behavior_no_args(mocker):
+def test_default_behavior_no_args(invoke, patched_client):
     # Mock the hourly forecast call which should be triggered by default
-    mock_get = mocker.patch("atmos.core.client.get_hourly_forecast")
+    mock_get = patched_client.hourly
 
     mock_get.return_value = [
-        HourlyForecastItem(
+        HourlyForecastItem.model_construct(
             timestamp=datetime(2023, 1, 1, 12, 0),
             temperature=Temperature(value=72.0, units="FAHRENHEIT"),
             feels_like=Temperature(value=70.0),
@@ -19,8 +18,7 @@ def test_default_behavior_no_args(mocker):
         )
     ]
 
-    runner = CliRunner()
-    result = runner.invoke(main, [])  # No args
+    result = invoke([])  # No args
 
     assert result.exit_code == 0
 
@@ -36,23 +34,23 @@ def test_default_behavior_no_args(mocker):
     assert kwargs.get("hours") == 120 or args[1] == 120
 
 
-def test_default_behavior_with_arg(mocker):
+def test_default_behavior_with_arg(invoke, patched_client):
     # Should still map to 'current'
-    mock_current = mocker.patch("atmos.core.client.get_current_conditions")
-    mock_current.return_value = mocker.Mock(
-        temperature=Temperature(value=20.0),
-        feels_like=Temperature(value=18.0),
+    mock_current = patched_client.current
+    # The render path only reads attributes, so plain namespaces suffice.
+    mock_current.return_value = SimpleNamespace(
+        temperature=SimpleNamespace(value=20.0, units="CELSIUS"),
+        feels_like=SimpleNamespace(value=18.0, units="CELSIUS"),
         description="Sunny",
-        wind=Wind(speed=1, direction="N"),
-        precipitation=Precipitation(),
+        wind=SimpleNamespace(speed=1, direction="N"),
+        precipitation=SimpleNamespace(type="None", rate=0.0, probability=0.0),
         humidity=50,
         uv_index=1,
         visibility=10,
         pressure=1000,
     )
 
-    runner = CliRunner()
-    result = runner.invoke(main, ["London"])
+    result = invoke(["London"])
 
     assert result.exit_code == 0
     mock_current.assert_called_once()
@@ -0,0 +1,108 @@
+from datetime import datetime
+from atmos.evaluator import SuitabilityEvaluator
+from atmos.models import DailyForecastItem, Temperature, Wind
+
+
+def make_day(high=75.0, low=60.0, precip=0.0, wind=0.0, cloud=0, moon="NEW_MOON"):
+    return DailyForecastItem.model_construct(
+        date=datetime(2023, 10, 6),
+        low_temp=Temperature(value=low, units="FAHRENHEIT"),
+        high_temp=Temperature(value=high, units="FAHRENHEIT"),
+        precipitation_probability=precip,
+        max_wind=Wind(speed=wind),
+        cloud_cover=cloud,
+        moon_phase=moon,
+    )
+
+
+def test_alias_and_unknown_activity():
+    assert SuitabilityEvaluator.evaluate(make_day(), "Hike") == (
+        100,
+        ["Great temp"],
+    )
+    score, reasons = SuitabilityEvaluator.evaluate(make_day(), "underwater chess")
+    assert score == 100
+    assert reasons == ["Unknown activity (Using generic logic)"]
+
+
+def test_every_alias_resolves_to_its_activity():
+    for key, aliases in SuitabilityEvaluator.ACTIVITIES.items():
+        for alias in aliases:
+            assert SuitabilityEvaluator._resolve(alias.upper()) == (key, True)
+
+
+def test_free_text_activity_matches_whole_word_alias():
+    assert SuitabilityEvaluator._resolve("Walk in the park") == ("hiking", True)
+    assert SuitabilityEvaluator._resolve("night photography trip") == (
+        "photography",
+        True,
+    )
+    # "run" inside another word is not a match.
+    assert SuitabilityEvaluator._resolve("brunch") == ("brunch", False)
+
+
+def test_rain_penalty_reset_for_stargazing():
+    # Stargazing ignores the generic rain penalty but keeps its note.
+    score, reasons = SuitabilityEvaluator.evaluate(
+        make_day(precip=80.0, cloud=30, moon="FULL_MOON"), "stars"
+    )
+    assert score == 30
+    assert reasons == [
+        "High rain chance (80%)",
+        "Some clouds (30%)",
+        "Bright Moon (FULL_MOON)",
+    ]
+
+
+def test_moon_follows_phase_changes_on_the_day():
+    day = make_day()
+    assert SuitabilityEvaluator.evaluate(day, "stars")[1] == [
+        "Clear skies",
+        "Dark sky",
+    ]
+    day.moon_phase = "FULL_MOON"
+    assert SuitabilityEvaluator.evaluate(day, "stars") == (
+        60,
+        ["Clear skies", "Bright Moon (FULL_MOON)"],
+    )
+
+
+def test_skiing_powder_bonus_and_clamp():
+    score, reasons = SuitabilityEvaluator.evaluate(
+        make_day(high=20.0, precip=60.0), "ski"
+    )
+    assert score == 100
+    assert reasons == [
+        "Chance of rain (60%)",
+        "Good snow temp",
+        "Fresh Powder likely",
+    ]
+
+    score, _ = SuitabilityEvaluator.evaluate(make_day(precip=50.0, wind=30.0), "drone")
+    assert score == 0
+
+
+def test_evaluate_batch_matches_evaluate():
+    days = [make_day(), make_day(precip=80.0), make_day(high=95.0, wind=25.0)]
+    assert SuitabilityEvaluator.evaluate_batch(days, "walk") == [
+        SuitabilityEvaluator.evaluate(day, "walk") for day in days
+    ]
+
+
+def test_cached_reasons_are_not_shared():
+    day = make_day(high=95.0)
+    _, reasons = SuitabilityEvaluator.evaluate(day, "hiking")
+    reasons.append("mutated")
+    assert SuitabilityEvaluator.evaluate(day, "hiking")[1] == ["Hot (95°F)"]
+
+
+def test_short_circuit_keeps_score_and_drops_later_notes():
+    day = make_day(precip=50.0, wind=30.0)
+    assert SuitabilityEvaluator.evaluate(day, "drone") == (
+        0,
+        ["Chance of rain (50%)", "Wind unsafe", "Rain risk"],
+    )
+    assert SuitabilityEvaluator.evaluate(day, "drone", full=False) == (
+        0,
+        ["Chance of rain (50%)", "Wind unsafe"],
+    )
@@ -1,14 +1,14 @@
-from atmos.places import PlacesManager
+import os
+import stat
+import sys
 
+import pytest
+from atmos.places import PlacesManager
 
-def test_places_manager(tmp_path, mocker):
-    # Patch the config directory to use a temp path
-    mocker.patch.object(PlacesManager, "__init__", return_value=None)
 
-    manager = PlacesManager()
-    manager.config_dir = tmp_path
-    manager.places_file = tmp_path / "places.json"
-    manager._ensure_file()
+def test_places_manager(tmp_path):
+    # Point the registry at a temp path
+    manager = PlacesManager(tmp_path / "places.json")
 
     # Test Add
     manager.add("Home", "123 Main St")
@@ -23,3 +23,41 @@ def test_places_manager(tmp_path, mocker):
     assert manager.remove("Home") is True
     assert manager.get("Home") is None
     assert manager.remove("Ghost") is False
+
+
+def test_places_manager_reloads_external_edits(tmp_path):
+    manager = PlacesManager(tmp_path / "places.json")
+
+    manager.add("Home", "123 Main St")
+    manager.list()["Home"] = "mutated"
+    assert manager.get("Home") == "123 Main St"
+
+    # Another process rewrites the file; the cached copy must be dropped.
+    manager.places_file.write_text('{"Work": "Office Addr"}')
+    assert manager.list() == {"Work": "Office Addr"}
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX links and modes")
+def test_places_save_keeps_symlink_and_mode(tmp_path):
+    real = tmp_path / "dotfiles" / "places.json"
+    real.parent.mkdir()
+    real.write_text("{}")
+    real.chmod(0o640)
+    link = tmp_path / "places.json"
+    link.symlink_to(real)
+
+    PlacesManager(link).add("Home", "123 Main St")
+
+    assert link.is_symlink()
+    assert PlacesManager(real).get("Home") == "123 Main St"
+    assert stat.S_IMODE(real.stat().st_mode) == 0o640
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX modes")
+def test_places_new_file_follows_umask(tmp_path):
+    old = os.umask(0o022)
+    try:
+        PlacesManager(tmp_path / "places.json")
+    finally:
+        os.umask(old)
+    assert stat.S_IMODE((tmp_path / "places.json").stat().st_mode) == 0o644